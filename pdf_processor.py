@@ -1,28 +1,85 @@
 import fitz  # PyMuPDF
+import functools
+import gc
 import logging
+import math
 import os
 import platform # <-- Add platform import
+import re
+from collections import OrderedDict
 import subprocess # <-- Add subprocess import
 import sys # <-- Add sys import
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk # Import Pillow for image resizing
-from typing import Optional, Dict, Callable
+from typing import Optional, Dict, Callable, Tuple
 from tkinterdnd2 import DND_FILES, TkinterDnD # Import TkinterDnD
-import threading # Added for running conversion in background
-import queue # Added for thread communication
-from pathlib import Path # <-- Add pathlib import
+import queue # queue.Empty, raised by the conversion queues
+import threading # Forwards conversion messages to the Tk event loop
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed # Parallel page conversion, background previews
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global cache for loaded fallback fonts {style_key: fitz.Font}
-fallback_fonts: Dict[str, Optional[fitz.Font]] = {}
+# Global cache for loaded fallback fonts {(style_key, font_path): fitz.Font}
+# Kept across conversions; keying on the path keeps it valid if fallback_paths changes
+fallback_fonts: Dict[Tuple[str, str], Optional[fitz.Font]] = {}
+
+# Fallback fonts by resolved file path {real_path: fitz.Font}
+fallback_font_files: Dict[str, Optional[fitz.Font]] = {}
 
 # Dictionary to hold paths to fallback fonts
 fallback_paths = {}
 
+# Fonts loaded by name, shared by all spans/pages so each is parsed and embedded once
+loaded_fonts: Dict[str, fitz.Font] = {}
+
+# Glyph coverage of the loaded fonts {fontname: {codepoint: has_glyph}}
+glyph_coverage: Dict[str, Dict[int, bool]] = {}
+
+# Whether a loaded font has every printable ASCII glyph {fontname: complete}
+# ASCII-only text in such a font needs no per-character check
+ascii_complete_fonts: Dict[str, bool] = {}
+
+# Font names that fitz.Font could not load {fontname: error message}
+# Loading only depends on the name, so spans using these go straight to the fallback
+unloadable_fonts: Dict[str, str] = {}
+
+# Style keywords in font names, matched in a single pass
+_FONT_NAME_STYLE_RE = re.compile(r'(?P<bold>bold|-bd)|(?P<italic>italic|oblique|-it)', re.IGNORECASE)
+
+# Standard fonts written as references instead of embedded programs {lowercase name}
+# Symbol and ZapfDingbats are left out, they don't use WinAnsiEncoding
+_LATIN_BASE14_FONTS = {key for key, name in fitz.Base14_fontdict.items() if name not in ("Symbol", "ZapfDingbats")}
+
+# Indirect object reference ("12 0 R") in a PDF object definition
+_INDIRECT_REF_RE = re.compile(r'\b\d+ \d+ R\b')
+
+# Path construction start operator (m or re) in a content stream
+_PATH_START_RE = re.compile(rb'(?:^|\s)(?:m|re)(?=[\s\[\]()<>/%{}]|$)')
+
+# Default number of pages converted before they are compressed into the output document
+OUTPUT_WINDOW_PAGES = 32
+
+# Shorter documents are converted in-process, the pool startup would cost more than it saves
+MIN_PARALLEL_PAGES = 4
+
+# Number of output previews kept by the GUI
+OUTPUT_PREVIEW_CACHE_SIZE = 4
+
+# Minimum seconds between progress messages sent to the GUI
+PROGRESS_REPORT_INTERVAL = 0.05
+
+# Number of input previews kept by the GUI
+PREVIEW_CACHE_SIZE = 8
+
+# Resource name of the /Difference blend ExtGState used by blend_invert
+_INVERT_GSTATE_NAME = "DarkModeInvert"
+
 # --- Helper function for PyInstaller assets ---
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -33,10 +90,9 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-# Helper function to draw rounded rectangles on a canvas
-def create_rounded_rect(canvas, x1, y1, x2, y2, radius, outline_color, outline_width, fill_color):
-    """Draws a rounded rectangle on a tkinter canvas."""
-    points = [
+def _rounded_rect_points(x1: int, y1: int, x2: int, y2: int, radius: int) -> Tuple[int, ...]:
+    """Smoothed-polygon points of a rounded rectangle, as integers."""
+    return (
         x1 + radius, y1,
         x1 + radius, y1,
         x2 - radius, y1,
@@ -57,201 +113,684 @@ def create_rounded_rect(canvas, x1, y1, x2, y2, radius, outline_color, outline_w
         x1, y1 + radius,
         x1, y1 + radius,
         x1, y1,
+    )
+
+# Helper function to draw rounded rectangles on a canvas
+def create_rounded_rect(canvas, x1, y1, x2, y2, radius, outline_color, outline_width, fill_color):
+    """Draws a rounded rectangle on a tkinter canvas, returns an id/tag usable with canvas methods."""
+    # Tk converts every coordinate to a string, integers are the cheap case
+    x1, y1, x2, y2, radius = round(x1), round(y1), round(x2), round(y2), round(radius)
+    if fill_color:
+        # Filled shapes need a single polygon
+        return canvas.create_polygon(_rounded_rect_points(x1, y1, x2, y2, radius), fill=fill_color, outline=outline_color, width=outline_width, smooth=True)
+
+    # Outlines are native arcs and lines, so Tk has no smoothed polygon to tessellate on redraw
+    diameter = 2 * radius
+    items = [
+        canvas.create_arc(x1, y1, x1 + diameter, y1 + diameter, start=90, extent=90, style=tk.ARC, outline=outline_color, width=outline_width),
+        canvas.create_arc(x2 - diameter, y1, x2, y1 + diameter, start=0, extent=90, style=tk.ARC, outline=outline_color, width=outline_width),
+        canvas.create_arc(x2 - diameter, y2 - diameter, x2, y2, start=270, extent=90, style=tk.ARC, outline=outline_color, width=outline_width),
+        canvas.create_arc(x1, y2 - diameter, x1 + diameter, y2, start=180, extent=90, style=tk.ARC, outline=outline_color, width=outline_width),
+        canvas.create_line(x1 + radius, y1, x2 - radius, y1, fill=outline_color, width=outline_width),
+        canvas.create_line(x2, y1 + radius, x2, y2 - radius, fill=outline_color, width=outline_width),
+        canvas.create_line(x1 + radius, y2, x2 - radius, y2, fill=outline_color, width=outline_width),
+        canvas.create_line(x1, y1 + radius, x1, y2 - radius, fill=outline_color, width=outline_width),
     ]
-    # Use empty string for fill if you only want outline
-    actual_fill = fill_color if fill_color else ""
-    return canvas.create_polygon(points, fill=actual_fill, outline=outline_color, width=outline_width, smooth=True)
+    tag = "rounded_rect_%d" % items[0]
+    for item in items:
+        canvas.addtag_withtag(tag, item)
+    return tag
+
+def set_rounded_rect_color(canvas, tag, color):
+    """Changes the outline color of a rounded rectangle drawn by create_rounded_rect."""
+    for item in canvas.find_withtag(tag):
+        # Lines are colored with fill, arcs with outline
+        if canvas.type(item) == "line":
+            canvas.itemconfig(item, fill=color)
+        else:
+            canvas.itemconfig(item, outline=color)
 
 def load_fallback_font(style='regular') -> Optional[fitz.Font]:
     """Loads a fallback font based on style, using caching."""
-    global fallback_fonts, fallback_paths
-    if style in fallback_fonts:
-        return fallback_fonts[style]
-
+    global fallback_fonts, fallback_font_files, fallback_paths
     font_path = fallback_paths.get(style)
+    cache_key = (style, font_path)
+    if cache_key in fallback_fonts:
+        return fallback_fonts[cache_key]
+
     if not font_path or not os.path.exists(font_path):
-        logger.error(f"Fallback font path not found or invalid for style '{style}': {font_path}")
+        logger.error("Fallback font path not found or invalid for style '%s': %s", style, font_path)
+        fallback_fonts[cache_key] = None # Checked once, not on every span that needs the style
         return None
 
+    # Styles configured with the same file (e.g. only a regular font available) share one copy
+    real_path = os.path.realpath(font_path)
+    if real_path in fallback_font_files:
+        font = fallback_font_files[real_path]
+        fallback_fonts[cache_key] = font
+        logger.info("Reusing fallback font loaded from %s for style '%s'", font_path, style)
+        return font
+
     try:
         font = fitz.Font(fontfile=font_path)
-        fallback_fonts[style] = font
-        logger.info(f"Successfully loaded fallback font '{style}' from {font_path}")
+        fallback_fonts[cache_key] = fallback_font_files[real_path] = font
+        logger.info("Successfully loaded fallback font '%s' from %s", style, font_path)
         return font
     except Exception as e:
-        logger.error(f"Failed to load fallback font '{style}' from {font_path}: {e}", exc_info=True)
-        fallback_fonts[style] = None # Cache failure to prevent retries
+        logger.error("Failed to load fallback font '%s' from %s: %s", style, font_path, e, exc_info=True)
+        fallback_fonts[cache_key] = fallback_font_files[real_path] = None # Cache failure to prevent retries
         return None
 
-def get_fallback_font_for_span(fontname: str, flags: int) -> Optional[tuple[fitz.Font, str]]:
-    """Determines the best fallback font style based on flags and attempts to load it."""
-    # Correctly check flags using bitwise AND
-    is_italic = bool(flags & 1)  # Check for Italic flag
-    is_bold = bool(flags & 16) # Check for Bold flag
-    logger.debug(f"Attempting fallback for font '{fontname}' (Flags: {flags}, Bold: {is_bold}, Italic: {is_italic})")
+def preload_fallback_fonts():
+    """Loads the fallback fonts of all configured styles, so no conversion pays for the first load."""
+    for style in fallback_paths:
+        load_fallback_font(style)
 
-    style_priority = []
+@functools.lru_cache(maxsize=None)
+def _fallback_style_priority(is_bold: bool, is_italic: bool) -> Tuple[str, ...]:
+    """Returns the fallback styles to try, in order, for a bold/italic combination."""
     if is_bold and is_italic:
-        style_priority = ['bold_italic', 'bold', 'italic', 'regular']
+        return ('bold_italic', 'bold', 'italic', 'regular')
     elif is_bold:
-        style_priority = ['bold', 'regular']
+        return ('bold', 'regular')
     elif is_italic:
-        style_priority = ['italic', 'regular']
-    else:
-        style_priority = ['regular']
+        return ('italic', 'regular')
+    return ('regular',)
 
+@functools.lru_cache(maxsize=512)
+def _font_name_style(fontname: str) -> Tuple[bool, bool]:
+    """Returns (is_bold, is_italic) as spelled out in a font name, e.g. 'Arial-BoldItalicMT'."""
+    styles = {match.lastgroup for match in _FONT_NAME_STYLE_RE.finditer(fontname)}
+    return 'bold' in styles, 'italic' in styles
+
+def get_fallback_font_for_span(fontname: str, flags: int) -> Optional[tuple[fitz.Font, str]]:
+    """Determines the best fallback font style based on flags and font name and attempts to load it."""
+    # Correctly check flags using bitwise AND, the font name covers fonts without style flags
+    name_bold, name_italic = _font_name_style(fontname)
+    is_italic = bool(flags & 1) or name_italic  # Check for Italic flag
+    is_bold = bool(flags & 16) or name_bold # Check for Bold flag
+    logger.debug("Attempting fallback for font '%s' (Flags: %s, Bold: %s, Italic: %s)", fontname, flags, is_bold, is_italic)
+
+    style_priority = _fallback_style_priority(is_bold, is_italic)
     for style_key in style_priority:
-        logger.debug(f"Trying style: '{style_key}'")
+        logger.debug("Trying style: '%s'", style_key)
         font = load_fallback_font(style_key)
         if font:
             fallback_fontname = f"Fallback-{style_key}"
-            logger.debug(f"SUCCESS: Found fallback font '{fallback_fontname}' for '{fontname}' (Style: {style_key})")
+            logger.debug("SUCCESS: Found fallback font '%s' for '%s' (Style: %s)", fallback_fontname, fontname, style_key)
             return font, fallback_fontname
 
-    logger.warning(f"FAILURE: No suitable fallback font found for '{fontname}' after trying styles: {style_priority}")
+    logger.warning("FAILURE: No suitable fallback font found for '%s' after trying styles: %s", fontname, style_priority)
     return None, None
 
-def convert_pdf_colors(input_pdf_path: str, output_pdf_path: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> Optional[str]:
-    """Converts PDF text to white and background to black, with progress callback."""
-    global fallback_fonts, fallback_paths # Ensure access to globals
+def _font_has_glyphs(fontname: str, font: fitz.Font, text: str) -> bool:
+    """Checks that a loaded font has glyphs for all printable characters of text, caching per codepoint."""
+    if text.isascii():
+        ascii_complete = ascii_complete_fonts.get(fontname)
+        if ascii_complete is None:
+            ascii_complete = ascii_complete_fonts[fontname] = all(font.has_glyph(codepoint) for codepoint in range(32, 127))
+        if ascii_complete:
+            return True
+    coverage = glyph_coverage.setdefault(fontname, {})
+    for char in set(text):
+        codepoint = ord(char)
+        if codepoint <= 31:
+            continue # Control characters are never drawn
+        has_glyph = coverage.get(codepoint)
+        if has_glyph is None:
+            has_glyph = coverage[codepoint] = bool(font.has_glyph(codepoint))
+        if not has_glyph:
+            return False
+    return True
+
+def _copy_encoded_image(doc: fitz.Document, xref: int, new_doc: fitz.Document) -> Optional[int]:
+    """Copies a self-contained image object to new_doc without decoding it.
+
+    Returns the new xref, or None if the image references other objects
+    (soft masks, ICC profiles...) or could not be copied.
+    """
+    try:
+        for key in doc.xref_get_keys(xref):
+            if key != "Length" and _INDIRECT_REF_RE.search(doc.xref_get_key(xref, key)[1]):
+                return None
+        new_xref = new_doc.get_new_xref()
+        new_doc.update_object(new_xref, doc.xref_object(xref, compressed=True))
+        new_doc.update_stream(new_xref, doc.xref_stream_raw(xref), compress=False)
+        # update_stream drops the filters for uncompressed data, but the raw stream is still encoded
+        for key in ("Filter", "DecodeParms"):
+            kind, value = doc.xref_get_key(xref, key)
+            if kind != "null":
+                new_doc.xref_set_key(new_xref, key, value)
+        return new_xref
+    except Exception as copy_err:
+        logger.debug("Could not copy image xref %d as-is: %s", xref, copy_err)
+        return None
+
+def _pdf_number(value: float) -> str:
+    """Formats a content stream operand in fixed-point notation; PDF has no exponent syntax."""
+    value = round(value, 5) # Also zeroes the near-zero noise of get_cdrawings
+    if not value:
+        return "0"
+    return ("%.5f" % value).rstrip("0").rstrip(".")
+
+def _pdf_numbers(values) -> str:
+    """Formats several content stream operands, separated by spaces."""
+    return " ".join([_pdf_number(value) for value in values])
+
+def _fill_color_operator(color: Tuple[float, ...]) -> str:
+    """Returns the PDF operator setting a gray, RGB or CMYK fill color."""
+    operator = {1: "g", 3: "rg", 4: "k"}[len(color)]
+    return _pdf_numbers(color) + " " + operator
+
+def _paint_group(path_ops: list, fill_color, width: float, even_odd: bool) -> str:
+    """Wraps the path operators of one style group with its graphics state and painting operator.
+
+    Mirrors Shape.finish: width 0 means no stroke. Closed subpaths already end
+    with their own h (see _render_page), so open ones stay open.
+    The white stroke color is set once by the page prolog, not per group.
+    """
+    if not path_ops:
+        return "" # Nothing drawable in this group
+    stroke = width != 0
+    # Graphics state first, path construction operators may only be followed by the painting operator
+    ops = ["q"]
+    if stroke and width != 1:
+        ops.append(_pdf_number(width) + " w")
+    if fill_color:
+        ops.append(_fill_color_operator(fill_color))
+    ops.extend(path_ops)
+    if stroke and fill_color:
+        ops.append("B*" if even_odd else "B")
+    elif fill_color:
+        ops.append("f*" if even_odd else "f")
+    elif stroke:
+        ops.append("S")
+    else:
+        ops.append("n")
+    ops.append("Q")
+    return "\n".join(ops)
+
+def _write_vector_content(new_page: fitz.Page, vector_ops: list):
+    """Writes vector operators, given in PyMuPDF's top-left page coordinates, as the page's base content.
+
+    A page made by new_page() has no /Contents yet, so the stream is created
+    here; text and images are appended after it, so the vectors stay underneath.
+    """
+    # Flip the y-axis once so the operators can use page coordinates directly
+    content = "q\n1 0 0 -1 0 %s cm\n%s\nQ\n" % (_pdf_number(new_page.rect.height), "\n".join(vector_ops))
+    contents = new_page.get_contents()
+    if contents:
+        new_page.parent.update_stream(contents[0], content.encode(), compress=False)
+    else:
+        _append_content_stream(new_page, content.encode())
+
+def _append_content_stream(new_page: fitz.Page, data: bytes):
+    """Adds a new content stream after the page's existing ones, creating /Contents if needed."""
+    new_doc = new_page.parent
+    xref = new_doc.get_new_xref()
+    new_doc.update_object(xref, "<<>>")
+    new_doc.update_stream(xref, data, compress=False)
+    contents = new_page.get_contents() + [xref]
+    new_doc.xref_set_key(new_page.xref, "Contents", "[%s]" % " ".join("%d 0 R" % content_xref for content_xref in contents))
+
+def _iter_spans(blocks):
+    """Yields the spans of all text blocks of a get_text("dict") result."""
+    for block in blocks:
+        if block["type"] == 0: # Text block
+            for line in block["lines"]:
+                yield from line["spans"]
+
+def _render_page(doc: fitz.Document, page: fitz.Page, new_page: fitz.Page, page_num: int, image_xrefs: Optional[Dict[int, int]] = None, image_digests: Optional[Dict[int, bytes]] = None):
+    """Draws the dark mode version of a source page onto an (empty) output page.
+
+    `image_xrefs` maps source image xrefs to images already embedded in the
+    output page's document; share it between pages of the same output document.
+    `image_digests` caches the pixel digests of source images; share it between
+    pages of the same source document.
+    """
+    if image_xrefs is None:
+        image_xrefs = {}
+    if image_digests is None:
+        image_digests = {}
+    # Define colors
+    white = (1, 1, 1)
+
+    # Background and drawings are written as raw PDF operators, in page coordinates (see _write_vector_content)
+    # Prolog: black background, then the stroke color every drawing group inherits
+    vector_ops = ["0 g 0 0 %s re f" % _pdf_numbers((new_page.rect.width, new_page.rect.height)), "1 1 1 RG"]
+
+    # Pages without content streams (blank separators) have nothing else to convert
+    if not page.get_contents():
+        _write_vector_content(new_page, vector_ops)
+        logger.debug("Page %d: No content streams, only the background was drawn.", page_num + 1)
+        return
+
+    # Decoded content, used to skip extraction passes for things the page can't contain
+    contents = page.read_contents()
+
+    # Extract drawings and draw them in white
+    # get_cdrawings skips get_drawings' conversion of every coordinate to Point/Rect objects.
+    # Fill-only/stroke-only paths omit the other style keys.
+    # Every path starts with m or re; without those (or a form XObject that may contain
+    # paths) the page is text/images only and the display list trace can be skipped.
+    if b"Do" in contents or _PATH_START_RE.search(contents):
+        drawings = page.get_cdrawings()
+    else:
+        drawings = []
+    logger.debug("Page %d: Found %d drawing paths.", page_num + 1, len(drawings))
+    # Consecutive paths with the same style are drawn as one group and painted once
+    group_style = None # (fill, width, even_odd) of the paths in group_ops
+    group_ops = []
+    append = group_ops.append
+    numbers = _pdf_numbers
+    page_width, page_height = new_page.rect.width, new_page.rect.height
+    for path in drawings:
+        # Read each path field once into locals
+        items = path["items"]
+        fill_color = path.get("fill") # Use original fill color
+        path_width = path.get("width")
+        x0, y0, x1, y1 = path["rect"]
+        if path_width is None:
+            if x1 <= x0 or y1 <= y0:
+                continue # Fill-only path without area paints nothing
+            path_width = 1.0 # Default width if None
+        elif path_width == 0 and not fill_color:
+            continue # Not stroked (see _paint_group) and not filled
+        # Half the line width can reach past the path's rect
+        margin = path_width / 2
+        if x1 < -margin or y1 < -margin or x0 > page_width + margin or y0 > page_height + margin:
+            continue # Entirely off-page
+        # Make lines/borders white, keep the original fill unless it's a filled rectangle
+        if fill_color and any(item[0] == "re" for item in items):
+            # Filled rectangle (likely a background or table cell), make fill white too
+            fill_color = white
+        path_style = (fill_color, path_width, path.get("even_odd", False)) # even_odd only exists on filled paths
+
+        # Style changed - paint the previous group before drawing this path
+        if path_style != group_style and group_style is not None:
+            vector_ops.append(_paint_group(group_ops, *group_style))
+            group_ops.clear()
+        group_style = path_style
+
+        # Process different path types
+        current_point = None # Connected segments continue the subpath without a new moveto
+        for item in items:
+            op = item[0]
+            if op == "l": # line
+                if item[1] != current_point:
+                    append(numbers(item[1]) + " m")
+                append(numbers(item[2]) + " l")
+                current_point = item[2]
+            elif op == "re": # rectangle
+                x0, y0, x1, y1 = item[1]
+                append(numbers((x0, y0, x1 - x0, y1 - y0)) + " re")
+                current_point = None
+            elif op == "c": # curve
+                if item[1] != current_point:
+                    append(numbers(item[1]) + " m")
+                append(numbers(item[2] + item[3] + item[4]) + " c")
+                current_point = item[4]
+            elif op == "qu": # quad
+                quad = fitz.Quad(item[1])
+                append("%s m %s l %s l %s l h" % (numbers(quad.ul), numbers(quad.ur), numbers(quad.lr), numbers(quad.ll)))
+                current_point = None
+        if path.get("closePath"):
+            append("h") # Close this path only, other paths of the group may be open
+    # Paint the last group
+    if group_style is not None:
+        vector_ops.append(_paint_group(group_ops, *group_style))
+    _write_vector_content(new_page, vector_ops) # Single content write for background and all drawings
+    logger.debug("Page %d: Finished processing drawings.", page_num + 1)
+
+    # Extract text blocks and insert with white color and fallback fonts
+    # Spans are collected into one white TextWriter per font and written once per page.
+    # Text in a standard font is written as operators referencing the Base-14 font instead:
+    # TextWriter would embed a full font program for it in every output.
+    writers: Dict[str, fitz.TextWriter] = {}
+    base14_ops = []
+    base14_fonts = set() # Resource names of the standard fonts used by base14_ops
+    reported_fonts = set() # Font names whose fallback was already logged for this page
+    # Pages without font resources can't contain text, so skip the extraction pass
+    # (get_fonts only reads the resource dictionaries, not the content stream)
+    # TEXTFLAGS_TEXT has no image blocks (images are copied below), and clipping to the visible
+    # page area keeps MuPDF from building blocks for text that would end up off-page anyway
+    blocks = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT, clip=page.rect)["blocks"] if page.get_fonts() else []
+    # Loop-invariant lookups bound once, the span loop runs for every piece of text in the document
+    get_loaded_font = loaded_fonts.get
+    get_font_error = unloadable_fonts.get
+    get_writer = writers.get
+    TextWriter = fitz.TextWriter
+    page_rect = new_page.rect
+    page_height = page_rect.height
+    numbers = _pdf_numbers
+    warn = logger.warning
+    info = logger.info
+    for span in _iter_spans(blocks):
+        text = span["text"]
+        if not text.strip():
+            continue # Whitespace-only span, nothing visible to draw
+        fontname = span["font"]
+        fontsize = span["size"]
+        origin = span["origin"] # TextWriter.append takes any point-like
+        flags = span["flags"]
+
+        # Attempt to find the font in the original document or load system font
+        font = get_loaded_font(fontname)
+        font_error = get_font_error(fontname) # Known-bad fonts skip the load attempt
+        if font is None and font_error is None:
+            try:
+                font = loaded_fonts[fontname] = fitz.Font(fontname=fontname)
+            except Exception as e:
+                font_error = unloadable_fonts[fontname] = str(e)
+        if font is not None:
+            # Check if font contains necessary glyphs (simple check)
+            if _font_has_glyphs(fontname, font, text):
+                current_fontname = fontname
+                current_font = font
+            else:
+                font_error = "Missing glyphs"
+        if font_error is not None:
+            # Font not found, invalid, or missing glyphs - use fallback
+            # Reported once per font and page, not for every span using it
+            report = fontname not in reported_fonts
+            if report:
+                reported_fonts.add(fontname)
+                warn("Font '%s' failed on page %d (Size: %.2f, Flags: %s): %s. Text: '%s...' Attempting fallback.", fontname, page_num + 1, fontsize, flags, font_error, text[:30])
+            fallback_font, fallback_fontname = get_fallback_font_for_span(fontname, flags)
+            if fallback_font:
+                current_font = fallback_font
+                current_fontname = fallback_fontname
+                if report:
+                    info("Using fallback '%s' for font '%s'.", current_fontname, fontname)
+            else:
+                logger.error("Critical: No fallback font available for '%s'. Skipping text: '%s...'", fontname, text[:30])
+                continue # Skip this span if no fallback available
 
-    # Clear font cache at the beginning of each conversion
-    fallback_fonts.clear()
-    logger.info("Fallback font cache cleared.")
+        # Queue text with the determined font; it is written in white below
+        if current_fontname.lower() in _LATIN_BASE14_FONTS:
+            try:
+                encoded = text.encode("cp1252") # WinAnsiEncoding, the referenced font's encoding
+            except UnicodeEncodeError:
+                encoded = None # Needs the embedded font's full glyph set
+            if encoded is not None:
+                base14_fonts.add(current_fontname)
+                base14_ops.append("BT /%s %s Tf 1 0 0 1 %s Tm <%s> Tj ET" % (current_fontname, numbers((fontsize,)), numbers((origin[0], page_height - origin[1])), encoded.hex()))
+                continue
+        writer = get_writer(current_fontname)
+        if writer is None:
+            writer = writers[current_fontname] = TextWriter(page_rect, color=white)
+        try:
+            writer.append(origin, text, font=current_font, fontsize=fontsize)
+        except Exception as text_insert_error:
+             logger.error("Error inserting text with font %s on page %d: %s. Text: '%s...'", current_fontname, page_num + 1, text_insert_error, text[:30], exc_info=True)
+
+    if base14_ops:
+        try:
+            for base14_fontname in base14_fonts:
+                new_page.insert_font(fontname=base14_fontname) # Registers a reference, nothing is embedded
+            _append_content_stream(new_page, ("q\n1 1 1 rg\n%s\nQ\n" % "\n".join(base14_ops)).encode())
+        except Exception as text_write_error:
+             logger.error("Error writing standard font text on page %d: %s", page_num + 1, text_write_error, exc_info=True)
+    for writer_fontname, writer in writers.items():
+        try:
+            writer.write_text(new_page)
+        except Exception as text_write_error:
+             logger.error("Error writing text with font %s on page %d: %s", writer_fontname, page_num + 1, text_write_error, exc_info=True)
+
+    # Handle Images (Copy images from original page to new page)
+    # get_images only reads the resources; placements come from one get_image_info pass below
+    img_list = page.get_images()
+    # Resource dictionaries are often shared between pages, so listed images may not be drawn
+    # here at all; without an XObject (Do) or inline image (BI) operator there is nothing to place
+    if img_list:
+        if b"Do" not in contents and b"BI" not in contents:
+            logger.debug("Page %d: %d images in resources but none drawn.", page_num + 1, len(img_list))
+            img_list = []
+    if img_list:
+         # Bbox and pixel digest of every image placement on the page in a single display list pass.
+         # get_image_info(xrefs=True) would match digests to xrefs itself, but by decoding every
+         # listed image again on every page; the digests are cached per source document instead.
+         xref_by_digest = {}
+         for img in img_list:
+              img_xref = img[0]
+              digest = image_digests.get(img_xref)
+              if digest is None:
+                  try:
+                      digest = image_digests[img_xref] = fitz.Pixmap(doc, img_xref).digest
+                  except Exception as digest_err:
+                      logger.warning("Page %d: Could not decode image xref %d: %s", page_num + 1, img_xref, digest_err)
+                      continue
+              xref_by_digest[digest] = img_xref
+         img_placements = page.get_image_info(hashes=True)
+         logger.info("Page %d: Found %d image placements.", page_num + 1, len(img_placements))
+         for img_info in img_placements:
+              xref = xref_by_digest.get(img_info["digest"])
+              if not xref:
+                  continue # Inline image, there is no image object to copy
+              img_rect = fitz.Rect(img_info["bbox"])
+              try:
+                  new_xref = image_xrefs.get(xref)
+                  if new_xref is None:
+                      new_xref = _copy_encoded_image(doc, xref, new_page.parent)
+                      if new_xref is not None:
+                          image_xrefs[xref] = new_xref
+                  if new_xref is not None:
+                      # Image already in the output (copied above or e.g. a repeated logo), just reference it
+                      new_page.insert_image(img_rect, xref=new_xref)
+                  else:
+                      # Image depends on other objects (soft mask, ICC profile...), let MuPDF re-embed it
+                      base_image = doc.extract_image(xref)
+                      image_xrefs[xref] = new_page.insert_image(img_rect, stream=base_image["image"])
+                  logger.debug("Page %d: Inserted image with xref %d at %s", page_num + 1, xref, img_rect)
+              except Exception as img_err:
+                   logger.error("Page %d: Failed to insert image xref %d: %s", page_num + 1, xref, img_err, exc_info=True)
+
+# Page worker pool kept between conversions, so its workers load the fallback fonts only once
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_workers = 0
+
+def _init_page_worker(paths: Dict[str, str]):
+    """Page pool initializer: loads the fallback fonts once per worker process."""
+    # Worker processes don't run the __main__ block, so the font paths come from the parent
+    fallback_paths.update(paths)
+    preload_fallback_fonts()
+
+def _get_page_pool(num_workers: int) -> ProcessPoolExecutor:
+    """Returns the persistent page pool, (re)starting it if it doesn't have `num_workers` workers."""
+    global _page_pool, _page_pool_workers
+    if _page_pool is None or _page_pool_workers != num_workers:
+        shutdown_page_pool()
+        _page_pool = ProcessPoolExecutor(max_workers=num_workers, initializer=_init_page_worker, initargs=(dict(fallback_paths),))
+        _page_pool_workers = num_workers
+    return _page_pool
+
+def shutdown_page_pool():
+    """Stops the page worker processes kept by convert_pdf_colors, if it started any."""
+    global _page_pool
+    if _page_pool is not None:
+        _page_pool.shutdown(cancel_futures=True)
+        _page_pool = None
+
+def _process_page_range(input_pdf_path: str, start: int, end: int, paths: Dict[str, str]) -> bytes:
+    """Worker entry point: converts pages [start, end) and returns them as one PDF."""
+    # The pool outlives a conversion, so font paths changed since it started travel with the task
+    fallback_paths.update(paths)
+
+    doc = fitz.open(input_pdf_path)
+    new_doc = fitz.open()
+    try:
+        image_xrefs: Dict[int, int] = {} # Images shared by the pages of this range are embedded once
+        image_digests: Dict[int, bytes] = {} # ...and decoded once to match their placements
+        for page_num in range(start, end):
+            page = doc[page_num]
+            logger.info("Processing page %d in worker process %d", page_num + 1, os.getpid())
+            new_page = new_doc.new_page(width=page.rect.width, height=page.rect.height)
+            _render_page(doc, page, new_page, page_num, image_xrefs, image_digests)
+        # Compressed, so the parent only ever holds deflated page content
+        return new_doc.tobytes(garbage=4, deflate=True)
+    finally:
+        new_doc.close()
+        doc.close()
 
+class _ConversionCancelled(Exception):
+    """Raised inside convert_pdf_colors once its cancel_event is set."""
+
+def _check_cancelled(cancel_event):
+    """Raises _ConversionCancelled if the conversion was asked to stop."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise _ConversionCancelled()
+
+def _append_compressed(new_doc: fitz.Document, window_doc: fitz.Document):
+    """Appends all pages of window_doc to new_doc with their streams deflated."""
+    compressed_doc = fitz.open("pdf", window_doc.tobytes(deflate=True))
+    new_doc.insert_pdf(compressed_doc)
+    compressed_doc.close()
+    window_doc.close()
+
+def _add_difference_overlay(new_doc: fitz.Document, new_page: fitz.Page, gstate_xref: int):
+    """Inverts a copied page by painting white over it with the /Difference blend mode."""
+    # Register the ExtGState in the page resources, following indirect dictionaries
+    res_kind, res_value = new_doc.xref_get_key(new_page.xref, "Resources")
+    if res_kind == "xref":
+        res_xref, res_path = int(res_value.split()[0]), "ExtGState"
+    else:
+        res_xref, res_path = new_page.xref, "Resources/ExtGState"
+    gs_kind, gs_value = new_doc.xref_get_key(res_xref, res_path)
+    if gs_kind == "xref":
+        res_xref, res_path = int(gs_value.split()[0]), ""
+    key = f"{res_path}/{_INVERT_GSTATE_NAME}" if res_path else _INVERT_GSTATE_NAME
+    new_doc.xref_set_key(res_xref, key, f"{gstate_xref} 0 R")
+
+    mediabox = new_page.mediabox
+    page_rect = _pdf_numbers((mediabox.x0, mediabox.y0, mediabox.width, mediabox.height))
+    # /Difference over the transparent backdrop leaves unpainted areas white,
+    # so the original content is drawn over an opaque white base
+    base = "q\n1 g\n%s re f\nQ\nq\n" % page_rect
+    # Bracket the original content in q/Q so an unbalanced CTM can't move the overlay
+    overlay = "Q\nq\n/%s gs\n1 g\n%s re f\nQ\n" % (_INVERT_GSTATE_NAME, page_rect)
+    stream_xrefs = []
+    for data in (base.encode(), overlay.encode()):
+        xref = new_doc.get_new_xref()
+        new_doc.update_object(xref, "<<>>")
+        new_doc.update_stream(xref, data)
+        stream_xrefs.append(xref)
+    contents = [stream_xrefs[0]] + new_page.get_contents() + [stream_xrefs[1]]
+    new_doc.xref_set_key(new_page.xref, "Contents", "[%s]" % " ".join("%d 0 R" % xref for xref in contents))
+
+def convert_pdf_colors(input_pdf_path: str, output_pdf_path: str, progress_callback: Optional[Callable[[int, int], None]] = None, num_workers: Optional[int] = None, window_size: int = OUTPUT_WINDOW_PAGES, blend_invert: bool = False, optimize: bool = False, cancel_event=None) -> Optional[str]:
+    """Converts PDF text to white and background to black, with progress callback.
+
+    Pages are converted in parallel by up to `num_workers` processes
+    (default: min(cpu_count, 4)), each taking a contiguous page range; pass 1,
+    or a document shorter than MIN_PARALLEL_PAGES, to convert in the calling process.
+    The worker processes are kept for later conversions, so each loads the
+    fallback fonts only once; shutdown_page_pool() stops them.
+    Pages are handled in windows of `window_size` pages whose output is
+    compressed into the result before the next window starts, which keeps
+    peak memory roughly constant for long documents.
+
+    With `blend_invert`, pages are copied unchanged and inverted by a white
+    /Difference overlay instead. This skips text and drawing extraction
+    entirely, but also inverts images and shifts the hue of colored content.
+
+    `optimize` additionally cleans and rewrites all content streams on save,
+    which costs noticeably more time for a small size gain.
+
+    Setting `cancel_event` (a threading or multiprocessing Event) stops the
+    conversion at its next page or page range; nothing is saved then.
+    """
     # Basic validation
     if not isinstance(input_pdf_path, str) or not input_pdf_path.lower().endswith('.pdf'):
         return "Invalid input file path. Must be a string ending with .pdf"
     if not isinstance(output_pdf_path, str) or not output_pdf_path.lower().endswith('.pdf'):
         return "Invalid output file path. Must be a string ending with .pdf"
 
+    if num_workers is None:
+        num_workers = min(os.cpu_count() or 1, 4)
+    window_size = max(1, window_size)
+
     try:
         doc = fitz.open(input_pdf_path)
         new_doc = fitz.open() # Create a new PDF for output
 
         total_pages = len(doc)
-        logger.info(f"Starting PDF conversion for '{input_pdf_path}' ({total_pages} pages)")
-
-        # Define colors
-        white = (1, 1, 1)
-        black = (0, 0, 0)
-
-        for page_num, page in enumerate(doc):
-            logger.info(f"Processing page {page_num + 1}/{total_pages}")
-
-            # Create a new page in the output document with the same dimensions
-            new_page = new_doc.new_page(width=page.rect.width, height=page.rect.height)
-
-            # Set background to black
-            # Use Shape to draw rect to avoid opacity issues sometimes seen with draw_rect
-            bg_shape = new_page.new_shape()
-            bg_shape.draw_rect(new_page.rect)
-            bg_shape.finish(color=black, fill=black, width=0) # Fill with black
-            bg_shape.commit()
-
-            # Extract drawings first and draw them in white
-            drawings = page.get_drawings()
-            drawing_shape = new_page.new_shape()
-            logger.debug(f"Page {page_num + 1}: Found {len(drawings)} drawing paths.")
-            for path in drawings:
-                # Make lines/borders white, keep fill transparent unless it's explicitly black
-                path_color = white # Default to white lines
-                fill_color = path['fill'] # Use original fill color
-                path_width = path['width'] if path['width'] is not None else 1.0 # Default width if None
-
-                # Process different path types
-                for item in path["items"]:
-                    op = item[0]
-                    if op == "l": # line
-                        drawing_shape.draw_line(item[1], item[2])
-                    elif op == "re": # rectangle
-                        # If rectangle is filled (likely a background or table cell), make fill white too
-                        if path['fill']:
-                           fill_color = white
-                        drawing_shape.draw_rect(item[1])
-                    elif op == "c": # curve
-                         drawing_shape.draw_bezier(item[1], item[2], item[3], item[4])
-                    elif op == "qu": # quad
-                         drawing_shape.draw_quad(item[1])
-                    # Finalize and commit each path segment individually or group logically
-                # Finish the path segment
-                drawing_shape.finish(color=path_color, fill=fill_color, width=path_width, even_odd=path.get('even_odd', False))
-            drawing_shape.commit() # Commit all drawing paths for the page
-            logger.debug(f"Page {page_num + 1}: Finished processing drawings.")
-
-            # Extract text blocks and insert with white color and fallback fonts
-            blocks = page.get_text("dict")["blocks"]
-            for block in blocks:
-                if block["type"] == 0: # Text block
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            text = span["text"]
-                            fontname = span["font"]
-                            fontsize = span["size"]
-                            origin = fitz.Point(span["origin"][0], span["origin"][1])
-                            flags = span["flags"]
-
-                            # Attempt to find the font in the original document or load system font
-                            try:
-                                font = fitz.Font(fontname=fontname)
-                                # Check if font contains necessary glyphs (simple check)
-                                if not all(font.has_glyph(ord(c)) for c in text if ord(c) > 31):
-                                    raise ValueError("Missing glyphs")
-                                current_fontname = fontname
-                                current_font = font
-                            except Exception as e:
-                                # Font not found, invalid, or missing glyphs - use fallback
-                                logger.warning(f"Font '{fontname}' failed on page {page_num + 1} (Size: {fontsize:.2f}, Flags: {flags}): {e}. Text: '{text[:30]}...' Attempting fallback.")
-                                fallback_font, fallback_fontname = get_fallback_font_for_span(fontname, flags)
-                                if fallback_font:
-                                    current_font = fallback_font
-                                    current_fontname = fallback_fontname
-                                    logger.info(f"Using fallback '{current_fontname}' for font '{fontname}'.")
-                                else:
-                                    logger.error(f"Critical: No fallback font available for '{fontname}'. Skipping text: '{text[:30]}...'" )
-                                    continue # Skip this span if no fallback available
-
-                            # Insert text with the determined font and white color
-                            try:
-                                insert_rc = new_page.insert_font(fontname=current_fontname, fontbuffer=current_font.buffer)
-                                if insert_rc < 0:
-                                     logger.error(f"Failed to insert font {current_fontname} into new page {page_num + 1}. RC: {insert_rc}")
-                                     continue # Skip if font insertion failed
-
-                                new_page.insert_text(origin, text, fontname=current_fontname,
-                                                     fontsize=fontsize, color=white)
-                            except Exception as text_insert_error:
-                                 logger.error(f"Error inserting text with font {current_fontname} on page {page_num + 1}: {text_insert_error}. Text: '{text[:30]}...'", exc_info=True)
-
-            # Handle Images (Copy images from original page to new page)
-            img_list = page.get_images(full=True)
-            if img_list:
-                 logger.info(f"Page {page_num + 1}: Found {len(img_list)} images.")
-                 for img_info in img_list:
-                      xref = img_info[0]
-                      base_image = doc.extract_image(xref)
-                      img_bytes = base_image["image"]
-                      img_rect = page.get_image_rects(xref)[0] # Get the first rectangle for the image
-                      try:
-                          new_page.insert_image(img_rect, stream=img_bytes)
-                          logger.debug(f"Page {page_num + 1}: Inserted image with xref {xref} at {img_rect}")
-                      except Exception as img_err:
-                           logger.error(f"Page {page_num + 1}: Failed to insert image xref {xref}: {img_err}", exc_info=True)
-
-            # --- Call progress callback --- 
-            if progress_callback:
-                try:
-                    progress_callback(page_num + 1, total_pages)
-                except Exception as cb_err:
-                     logger.warning(f"Progress callback failed on page {page_num + 1}: {cb_err}", exc_info=False) # Don't log full trace for callback errors
+        logger.info("Starting PDF conversion for '%s' (%d pages, %d workers)", input_pdf_path, total_pages, num_workers)
+        windows = [range(start, min(start + window_size, total_pages)) for start in range(0, total_pages, window_size)]
+
+        if blend_invert:
+            # Copy the pages as they are, the overlay does the whole color conversion
+            new_doc.insert_pdf(doc)
+            doc.close()
+            gstate_xref = new_doc.get_new_xref()
+            new_doc.update_object(gstate_xref, "<</Type/ExtGState/BM/Difference>>")
+            for page_num, new_page in enumerate(new_doc):
+                _check_cancelled(cancel_event)
+                _add_difference_overlay(new_doc, new_page, gstate_xref)
+                _report_progress(progress_callback, page_num + 1, total_pages)
+        elif num_workers > 1 and total_pages >= MIN_PARALLEL_PAGES:
+            # Each worker opens the input itself, so the parent only needs the page count
+            doc.close()
+            paths = dict(fallback_paths)
+            pages_done = 0
+            executor = _get_page_pool(num_workers)
+            futures = []
+            try:
+                for window in windows:
+                    # Split the window into one contiguous page range per worker, so each
+                    # worker opens the input once per window rather than once per page
+                    range_size = math.ceil(len(window) / num_workers)
+                    ranges = [(start, min(start + range_size, window.stop)) for start in range(window.start, window.stop, range_size)]
+                    futures = [executor.submit(_process_page_range, input_pdf_path, start, end, paths) for start, end in ranges]
+                    range_pages = {future: end - start for future, (start, end) in zip(futures, ranges)}
+                    # Ranges finish in any order; report progress as they complete
+                    for future in as_completed(futures):
+                        future.result() # Surface worker errors right away
+                        pages_done += range_pages[future]
+                        _report_progress(progress_callback, pages_done, total_pages)
+                        _check_cancelled(cancel_event) # Queued ranges are cancelled below
+                    # Append in page order
+                    for future in futures:
+                        range_doc = fitz.open("pdf", future.result()) # Already deflated by the worker
+                        new_doc.insert_pdf(range_doc)
+                        range_doc.close()
+                    futures, range_pages = [], None # Drop the window's result bytes before collecting
+                    gc.collect()
+            except BrokenProcessPool:
+                shutdown_page_pool() # A worker died, the next conversion starts a fresh pool
+                raise
+            finally:
+                for future in futures:
+                    future.cancel() # Nothing of a failed conversion stays queued in the shared pool
+        else:
+            image_digests: Dict[int, bytes] = {} # Source image digests, valid for the whole document
+            for window in windows:
+                # Uncompressed page content only lives in the window document
+                window_doc = fitz.open()
+                window_image_xrefs: Dict[int, int] = {} # Images embedded in the window document
+                for page_num in window:
+                    _check_cancelled(cancel_event)
+                    logger.info("Processing page %d/%d", page_num + 1, total_pages)
+                    page = doc[page_num]
+                    # Create a new page in the output document with the same dimensions
+                    new_page = window_doc.new_page(width=page.rect.width, height=page.rect.height)
+                    _render_page(doc, page, new_page, page_num, window_image_xrefs, image_digests)
+                    _report_progress(progress_callback, page_num + 1, total_pages)
+                _append_compressed(new_doc, window_doc)
+                gc.collect()
+            doc.close()
 
         # Save the new document
-        new_doc.save(output_pdf_path, garbage=4, deflate=True, clean=True)
+        # garbage=4 stays on: every window/range brings its own copy of the fonts and images it
+        # uses, and only stream-comparing garbage collection merges those. clean=True would parse
+        # and rewrite every content stream we just generated, so it is opt-in.
+        new_doc.save(output_pdf_path, garbage=4, deflate=True, deflate_images=True, deflate_fonts=True, clean=optimize)
         new_doc.close()
-        doc.close()
-        logger.info(f"Successfully created dark mode PDF: '{output_pdf_path}'")
+        logger.info("Successfully created dark mode PDF: '%s'", output_pdf_path)
         return None # Indicate success
 
+    except _ConversionCancelled:
+        logger.info("Conversion of '%s' cancelled.", input_pdf_path)
+        return "Conversion cancelled."
     except FileNotFoundError:
         error_msg = f"Error: Input file not found at '{input_pdf_path}'"
         logger.error(error_msg)
@@ -265,7 +804,92 @@ def convert_pdf_colors(input_pdf_path: str, output_pdf_path: str, progress_callb
         logger.error(error_msg, exc_info=True) # Log full traceback
         return error_msg
 
+def _report_progress(progress_callback: Optional[Callable[[int, int], None]], current_page: int, total_pages: int):
+    """Calls the progress callback, never letting a callback error abort the conversion."""
+    if progress_callback:
+        try:
+            progress_callback(current_page, total_pages)
+        except Exception as cb_err:
+             logger.warning("Progress callback failed on page %d: %s", current_page, cb_err, exc_info=False) # Don't log full trace for callback errors
+
+# Progress queue and cancel event of the GUI's conversion process, set by _init_conversion_process
+_conversion_progress_queue = None
+_conversion_cancel_event = None
+
+def _init_conversion_process(progress_queue, cancel_event, paths: Dict[str, str]):
+    """Conversion executor initializer: keeps the progress queue, cancel event and font paths for the tasks."""
+    global _conversion_progress_queue, _conversion_cancel_event
+    # Queues and events can't be pickled into task arguments, only handed over when the process starts
+    _conversion_progress_queue = progress_queue
+    _conversion_cancel_event = cancel_event
+    fallback_paths.update(paths)
+
+def _convert_in_process(input_pdf_path: str, output_pdf_path: str) -> Optional[str]:
+    """Conversion executor task: converts one file, reporting progress through the initializer's queue.
+
+    Arguments and result are plain strings, so they pickle across the process boundary.
+    """
+    last_percent = None
+    last_report_time = 0.0
+    def report(current_page, total_pages):
+        # Only whole-percent steps cross the process boundary, the progress bar can't show finer ones,
+        # and at most one per PROGRESS_REPORT_INTERVAL except for the final page
+        nonlocal last_percent, last_report_time
+        percent = current_page * 100 // total_pages
+        if percent == last_percent:
+            return
+        now = time.monotonic()
+        if current_page == total_pages or now - last_report_time >= PROGRESS_REPORT_INTERVAL:
+            last_percent = percent
+            last_report_time = now
+            _conversion_progress_queue.put(("progress", current_page, total_pages))
+
+    return convert_pdf_colors(input_pdf_path, output_pdf_path, report, cancel_event=_conversion_cancel_event)
+
+def render_preview_image(pdf_path: str, box_width: int, box_height: int, border_width: int) -> Tuple[fitz.Pixmap, Image.Image]:
+    """Renders the first page of a PDF to fit inside a preview box; safe to call from any thread.
+
+    Returns the pixmap together with the image wrapping its memory, keep both until the image is used.
+    """
+    doc = None
+    try:
+        logger.debug("Opening '%s' for preview.", pdf_path)
+        # Opened per render: both previews are cached per file version, so an unchanged file
+        # is never rendered twice, and an open handle would keep Windows from overwriting it
+        doc = fitz.open(pdf_path)
+        if len(doc) == 0: raise ValueError("PDF document has no pages.")
+        page = doc[0]
+
+        target_width_available = box_width - (2 * border_width)
+        target_height_available = box_height - (2 * border_width)
+        page_rect = page.rect
+        page_width = page_rect.width
+        page_height = page_rect.height
+        if page_width <= 0 or page_height <= 0:
+             raise ValueError(f"Invalid page dimensions: {page_width}x{page_height}")
+
+        zoom_w = target_width_available / page_width
+        zoom_h = target_height_available / page_height
+        zoom = min(zoom_w, zoom_h)
+        # Render straight at the preview size, no intermediate high-resolution pixmap to downscale
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        if doc: doc.close(); doc = None
+
+        # alpha=False always gives RGB samples, which Pillow can wrap without copying;
+        # samples_mv is a view of the pixmap memory (samples would be a bytes copy)
+        pil_image = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1)
+        return pix, pil_image
+    finally:
+        if doc: doc.close()
+
 class PDFDarkModeApp:
+    # Progress bar geometry
+    _PROGRESS_BORDER = 6
+    _PROGRESS_CORNER = 10
+    _PROGRESS_BAR_H = 40
+    # Previews, texts and icons in the two boxes; the borders stay for the app's lifetime
+    _BOX_CONTENT_TAG = "box_content"
+
     def __init__(self, root):
         self.root = root # root is now a TkinterDnD.Tk object
         self.root.title("PDF Dark Mode Converter")
@@ -278,14 +902,30 @@ class PDFDarkModeApp:
         self.output_pdf_path = None
         self.button_state = tk.NORMAL
         self.preview_image_tk = None
+        self.preview_cache: "OrderedDict[Tuple[str, float], ImageTk.PhotoImage]" = OrderedDict() # {(path, mtime): input preview}
         self.upload_icon_image = None
         self.output_preview_image_tk = None
+        self.preview_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview") # Renders input and output previews
+        self.output_preview_cache: "OrderedDict[Tuple[str, float, int, int], ImageTk.PhotoImage]" = OrderedDict() # {(path, mtime, width, height): output preview}
         self.progress_fill_id = None # ID for the progress bar fill rectangle
+        self.progress_fill_px = None # Fill width in whole pixels when it was last drawn
         self.app_state = "initial" # Add state variable: initial, ready, converting, finished
 
-        # --- Threading & Queue --- 
-        self.conversion_thread = None
-        self.progress_queue = queue.Queue()
+        # --- Conversion Process & Queues --- 
+        # One long-lived worker process converts every file, so it starts once and keeps fonts loaded
+        self.conversion_responses = multiprocessing.Queue() # ("progress", current, total), None stops the listener
+        self.conversion_cancel = multiprocessing.Event() # Set to stop a running conversion at its next page
+        self.conversion_executor = None
+        self.conversion_active = False
+        self.start_conversion_executor()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Progress (via a listener thread) and results (via future callbacks) are put on
+        # gui_messages and wake Tk with <<Progress>>, so the main loop only runs when there is something to show
+        self.gui_messages = queue.Queue()
+        self.progress_event_pending = False # A <<Progress>> event is queued and will drain gui_messages
+        self.root.bind("<<Progress>>", lambda event: self.check_progress_queue())
+        self.response_listener = threading.Thread(target=self.forward_conversion_responses, name="conversion-listener", daemon=True)
+        self.response_listener.start()
         self.status_animation_after_id = None # To store the .after() id
 
         # --- Styling ---
@@ -319,15 +959,16 @@ class PDFDarkModeApp:
             arrow_img_pil = Image.open(arrow_img_path)
             arrow_width = arrow_img_pil.width
             self.arrow_image = ImageTk.PhotoImage(arrow_img_pil) # Store Tk image for later use
-            logger.debug(f"Arrow image loaded from {arrow_img_path}, width: {arrow_width}")
+            logger.debug("Arrow image loaded from %s, width: %s", arrow_img_path, arrow_width)
         except Exception as e:
-             logger.warning(f"Could not load arrow.png to determine width: {e}")
+             logger.warning("Could not load arrow.png to determine width: %s", e)
              # Estimate or use a default if needed, or make progress bar width fixed
              arrow_width = 50 # Estimate if loading failed
 
         # Left Box
         self.left_box = tk.Canvas(self.component2_frame, width=box_width, height=box_height, bg=fill_color, highlightthickness=0)
         self.left_box.pack(side=tk.LEFT, padx=(0, arrow_gap))
+        self.left_box_border_id = create_rounded_rect(self.left_box, border_width/2, border_width/2, box_width - border_width/2, box_height - border_width/2, corner_radius, border_color, border_width, "")
 
         # Arrow Label
         if hasattr(self, 'arrow_image'):
@@ -341,7 +982,7 @@ class PDFDarkModeApp:
         # Right Box
         self.right_box = tk.Canvas(self.component2_frame, width=box_width, height=box_height, bg=fill_color, highlightthickness=0)
         self.right_box.pack(side=tk.LEFT)
-        create_rounded_rect(self.right_box, border_width/2, border_width/2, box_width - border_width/2, box_height - border_width/2, corner_radius, border_color, border_width, "")
+        self.right_box_border_id = create_rounded_rect(self.right_box, border_width/2, border_width/2, box_width - border_width/2, box_height - border_width/2, corner_radius, border_color, border_width, "")
 
         # --- Component 3: Convert Button / Progress Bar Container ---
         self.button_progress_frame = ttk.Frame(root, style="TFrame")
@@ -350,7 +991,12 @@ class PDFDarkModeApp:
         button_height = 40 # Progress bar height will match this
         # Calculate dynamic progress bar width
         self.progress_bar_width = box_width + arrow_gap + arrow_width + arrow_gap + box_width
-        logger.debug(f"Calculated progress bar width: {self.progress_bar_width}")
+        logger.debug("Calculated progress bar width: %s", self.progress_bar_width)
+        # Fill geometry that doesn't depend on progress, computed once instead of per update
+        self.progress_fill_area_width = self.progress_bar_width - self._PROGRESS_BORDER
+        self.progress_fill_x1 = round(self._PROGRESS_BORDER / 2)
+        self.progress_fill_y1 = round(self._PROGRESS_BORDER / 2)
+        self.progress_fill_y2 = round(self._PROGRESS_BAR_H - self._PROGRESS_BORDER / 2)
 
         # --- Create Button Canvas (initially shown) ---
         button_width_fixed = 256 # Keep button fixed size
@@ -365,6 +1011,10 @@ class PDFDarkModeApp:
         self.progress_canvas = tk.Canvas(self.button_progress_frame, width=self.progress_bar_width, height=button_height, bg=fill_color, highlightthickness=0)
         # Draw initial border but don't pack yet
         create_rounded_rect(self.progress_canvas, border_width/2, border_width/2, self.progress_bar_width - border_width/2, button_height - border_width/2, corner_radius, border_color, border_width, "")
+        # The fill is created once, progress updates only move its right edge
+        self.progress_fill_id = create_rounded_rect(self.progress_canvas, border_width/2, border_width/2, border_width/2, button_height - border_width/2, corner_radius, "white", 0, "white")
+        self.progress_canvas.tag_lower(self.progress_fill_id) # Border (several items) stays on top
+        self.set_progress_fill(0)
 
         # --- Setup Drop Target for the ROOT window ---
         self.root.drop_target_register(DND_FILES)
@@ -373,7 +1023,7 @@ class PDFDarkModeApp:
         # Removed drop target setup from self.left_box
 
         # Initial setup of icon/text in left box
-        self.recreate_left_box_initial_content() # This now also draws initial border
+        self.recreate_left_box_initial_content()
 
     def center_window(self):
         """Centers the window on the screen."""
@@ -387,7 +1037,7 @@ class PDFDarkModeApp:
     def handle_drop(self, event):
         """Handles file drop events on the left box."""
         filepath_string = event.data
-        logger.debug(f"<<Drop>> event received. Data: '{filepath_string}'")
+        logger.debug("<<Drop>> event received. Data: '%s'", filepath_string)
 
         # Clean up the path string (remove braces, handle potential quoting)
         if filepath_string.startswith('{') and filepath_string.endswith('}'):
@@ -402,10 +1052,10 @@ class PDFDarkModeApp:
 
         # Check if the cleaned path exists and is a PDF file
         if filepath and os.path.isfile(filepath) and filepath.lower().endswith('.pdf'):
-            logger.info(f"File dropped: {filepath}")
+            logger.info("File dropped: %s", filepath)
             self.process_selected_file(filepath)
         else:
-            logger.warning(f"Dropped item is not a valid PDF file path: '{filepath}'")
+            logger.warning("Dropped item is not a valid PDF file path: '%s'", filepath)
             messagebox.showwarning("Invalid Drop", "Lütfen yalnızca tek bir PDF dosyası sürükleyin.")
 
 
@@ -417,7 +1067,7 @@ class PDFDarkModeApp:
             filetypes=(("PDF files", "*.pdf"), ("All files", "*.*"))
         )
         if filepath:
-            logger.info(f"File selected via dialog: {filepath}")
+            logger.info("File selected via dialog: %s", filepath)
             self.process_selected_file(filepath)
         else:
             logger.info("File selection cancelled.")
@@ -425,138 +1075,113 @@ class PDFDarkModeApp:
 
     def process_selected_file(self, filepath: str):
         """Processes the selected/dropped PDF: Generates preview and updates UI."""
-        logger.debug(f"Processing file: {filepath}")
-        doc = None
+        logger.debug("Processing file: %s", filepath)
         try:
             # Define dimensions
             box_width = 371
             box_height = 466
             border_width = 6
-            corner_radius = 10
-            logger.debug(f"Processing with Box dimensions: width={box_width}, height={box_height}, border={border_width}")
+            logger.debug("Processing with Box dimensions: width=%s, height=%s, border=%s", box_width, box_height, border_width)
 
             # --- Update state --- 
             self.input_pdf_path = filepath
-            base_name = os.path.basename(filepath)
             # Reset status label to non-clickable state before showing standard message
             self.status_label.config(text="DÖNÜŞTÜR butonuna bas", style="Status.TLabel", cursor="")
             self.status_label.unbind("<Button-1>")
             self.app_state = "ready" # Set state to ready for conversion
-            logger.info(f"Input PDF set: {self.input_pdf_path}, App state: {self.app_state}")
+            logger.info("Input PDF set: %s, App state: %s", self.input_pdf_path, self.app_state)
 
             # --- Clear existing content --- 
             logger.debug("Clearing left and right boxes for preview.")
-            self.left_box.delete("all") 
+            self.left_box.delete(self._BOX_CONTENT_TAG)
             self.right_box.configure(bg="black") # Ensure right box is black before clearing
-            self.right_box.delete("all") 
+            self.right_box.delete(self._BOX_CONTENT_TAG)
             self.right_box.config(cursor="") # Reset cursor
             self.right_box.unbind("<Button-1>") # Unbind click
 
-            # --- Render and Resize PDF Preview using Pillow --- 
-            logger.debug("Opening PDF document for preview.")
-            doc = fitz.open(self.input_pdf_path)
-            if len(doc) == 0: raise ValueError("PDF document has no pages.")
-            page = doc[0]
-            logger.debug(f"Processing page 0: {page.rect}")
-
-            target_width_available = box_width - (2 * border_width)
-            target_height_available = box_height - (2 * border_width)
-            page_rect = page.rect
-            page_width = page_rect.width
-            page_height = page_rect.height
-            logger.debug(f"Available space: width={target_width_available}, height={target_height_available}")
-            logger.debug(f"Original page size: width={page_width}, height={page_height}")
-
-            if page_width <= 0 or page_height <= 0:
-                raise ValueError(f"Invalid page dimensions: {page_width}x{page_height}")
-
-            # Calculate zoom factor to fit within available space
-            zoom_w = target_width_available / page_width
-            zoom_h = target_height_available / page_height
-            zoom = min(zoom_w, zoom_h)
-            logger.debug(f"Calculated zoom factors: width_zoom={zoom_w:.4f}, height_zoom={zoom_h:.4f}, chosen_zoom={zoom:.4f}")
-
-            # Calculate final target dimensions for the preview image
-            final_width = int(page_width * zoom)
-            final_height = int(page_height * zoom)
-            logger.debug(f"Target preview dimensions: width={final_width}, height={final_height}")
-
-            # Render pixmap at a reasonable base resolution
-            mat = fitz.Matrix(1, 1) # Render at original scale
-            logger.debug("Rendering pixmap at native scale (dpi=150).")
-            pix = page.get_pixmap(matrix=mat, dpi=150)
-            logger.debug(f"Pixmap rendered: width={pix.width}, height={pix.height}, alpha={pix.alpha}")
-
-            # Close PDF document now that we have the pixmap
-            if doc: doc.close(); doc = None
-            logger.debug("PDF document closed.")
-
-            # --- Convert pixmap to Pillow Image and Resize --- 
-            logger.debug("Converting pixmap to Pillow Image.")
-            if pix.alpha:
-                pil_image = Image.frombytes("RGBA", [pix.width, pix.height], pix.samples)
-            else:
-                pil_image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            logger.debug(f"Pillow Image created: size={pil_image.size}")
-
-            logger.debug(f"Resizing Pillow Image to {final_width}x{final_height} using LANCZOS.")
-            resized_pil_image = pil_image.resize((final_width, final_height), Image.Resampling.LANCZOS)
-            logger.debug(f"Pillow Image resized: size={resized_pil_image.size}")
-
-            # --- Convert resized Pillow Image to Tkinter PhotoImage --- 
-            logger.debug("Converting resized Pillow Image to tk.PhotoImage.")
-            self.preview_image_tk = ImageTk.PhotoImage(resized_pil_image)
-            logger.debug(f"PhotoImage created from resized Pillow image: {self.preview_image_tk}")
-            tk_img_width = self.preview_image_tk.width()
-            tk_img_height = self.preview_image_tk.height()
-            logger.debug(f"PhotoImage dimensions (Tkinter): width={tk_img_width}, height={tk_img_height}")
-
-            # --- Display Preview --- 
-            logger.debug("Displaying preview image.")
-            create_rounded_rect(self.left_box, border_width/2, border_width/2, box_width - border_width/2, box_height - border_width/2, corner_radius, "white", border_width, "")
-            img_x_pos = box_width / 2
-            img_y_pos = box_height / 2
-            logger.debug(f"Placing PhotoImage on canvas at ({img_x_pos}, {img_y_pos}) with anchor=CENTER.")
-            self.left_box.create_image(img_x_pos, img_y_pos, anchor=tk.CENTER, image=self.preview_image_tk)
-            logger.debug("create_image called.")
-            # Reset cursor for left box now that preview is shown
-            self.left_box.config(cursor="")
-            self.left_box.unbind("<Enter>") # Unbind hover effects
-            self.left_box.unbind("<Leave>")
-
-            # --- Redraw Right Box & Enable Button --- 
-            logger.debug("Redrawing right box border (black background) and enabling button after preview.")
-            # Ensure right box is not clickable yet
-            self.right_box.config(cursor="")
-            self.right_box.unbind("<Button-1>")
-            create_rounded_rect(self.right_box, border_width/2, border_width/2, box_width - border_width/2, box_height - border_width/2, corner_radius, "white", border_width, "")
-            self.set_button_state(tk.NORMAL)
-            logger.debug(f"Processing finished for file: {filepath}")
+            # --- Render PDF Preview --- 
+            # Previews are cached per file version, so reopening an unchanged file skips rendering
+            cache_key = (filepath, os.path.getmtime(filepath))
+            cached_preview = self.preview_cache.get(cache_key)
+            if cached_preview is not None:
+                logger.debug("Using cached preview.")
+                self.preview_cache.move_to_end(cache_key)
+                self.display_input_preview(cached_preview)
+                return
+
+            # Rendered on the preview thread like the output preview; the button stays
+            # disabled until the file has turned out to be a readable PDF
+            self.set_button_state(tk.DISABLED)
+            logger.debug("Rendering preview in the background.")
+            future = self.preview_executor.submit(render_preview_image, filepath, box_width, box_height, border_width)
+            future.add_done_callback(lambda done: self.root.after(0, self.finish_input_preview, cache_key, done))
+        except Exception as e:
+             self.show_input_preview_error(e)
 
+    def finish_input_preview(self, cache_key, future):
+        """Tk thread: turns a background-rendered input preview into a PhotoImage and displays it."""
+        if cache_key[0] != self.input_pdf_path:
+            logger.debug("Discarding preview of %s, another file was selected.", cache_key[0])
+            return
+        try:
+            pix, pil_image = future.result() # pix owns the memory pil_image wraps
+            preview = ImageTk.PhotoImage(pil_image)
+            logger.debug("PhotoImage created: %s", preview)
         except Exception as e:
-             if doc: doc.close() # Ensure doc is closed on error
-             error_msg = f"Error processing selected/dropped file: {e}"
-             logger.error(error_msg, exc_info=True)
-             messagebox.showerror("PDF Processing Error", error_msg)
-             # Reset state
-             logger.debug("Resetting state after error during file processing.")
-             self.input_pdf_path = None
-             self.status_label.config(text="Okunabilir hale getirmek istediğin dosyayı seç veya alana sürükle", style="Status.TLabel", cursor="")
-             self.status_label.unbind("<Button-1>")
-             # Reset boxes to initial state
-             self.recreate_left_box_initial_content() # Handles left box clearing/redrawing
-             self.right_box.configure(bg="black") # Ensure right box is black on error reset
-             self.right_box.delete("all") # Clear right box
-             # Redraw right border
-             box_width = 371
-             box_height = 466
-             border_width = 6
-             corner_radius = 10
-             create_rounded_rect(self.right_box, border_width/2, border_width/2, box_width - border_width/2, box_height - border_width/2, corner_radius, "white", border_width, "")
-             self.set_button_state(tk.NORMAL)
-             self.app_state = "initial" # Reset state on error
-             # Ensure cursor is reset on error too if recreate doesn't handle it
-             self.left_box.config(cursor="")
+            self.show_input_preview_error(e)
+            return
+        self.preview_cache[cache_key] = preview
+        if len(self.preview_cache) > PREVIEW_CACHE_SIZE:
+            self.preview_cache.popitem(last=False) # Drop the least recently used preview
+        self.display_input_preview(preview)
+
+    def display_input_preview(self, preview):
+        """Shows the input preview in the left box and readies the UI for conversion."""
+        box_width = 371
+        box_height = 466
+        self.preview_image_tk = preview # Keep a reference, Tk doesn't
+        tk_img_width = self.preview_image_tk.width()
+        tk_img_height = self.preview_image_tk.height()
+        logger.debug("PhotoImage dimensions (Tkinter): width=%s, height=%s", tk_img_width, tk_img_height)
+
+        # --- Display Preview --- 
+        logger.debug("Displaying preview image.")
+        img_x_pos = box_width / 2
+        img_y_pos = box_height / 2
+        logger.debug("Placing PhotoImage on canvas at (%s, %s) with anchor=CENTER.", img_x_pos, img_y_pos)
+        self.left_box.create_image(img_x_pos, img_y_pos, anchor=tk.CENTER, image=self.preview_image_tk, tags=self._BOX_CONTENT_TAG)
+        logger.debug("create_image called.")
+        # Reset cursor for left box now that preview is shown
+        self.left_box.config(cursor="")
+        self.left_box.unbind("<Enter>") # Unbind hover effects
+        self.left_box.unbind("<Leave>")
+
+        # --- Enable Button --- 
+        logger.debug("Enabling button after preview.")
+        # Ensure right box is not clickable yet
+        self.right_box.config(cursor="")
+        self.right_box.unbind("<Button-1>")
+        self.set_button_state(tk.NORMAL)
+        logger.debug("Processing finished for file: %s", self.input_pdf_path)
+
+    def show_input_preview_error(self, error):
+        """Reports a file that can't be previewed and resets the UI to its initial state."""
+        error_msg = f"Error processing selected/dropped file: {error}"
+        logger.error(error_msg, exc_info=error)
+        messagebox.showerror("PDF Processing Error", error_msg)
+        # Reset state
+        logger.debug("Resetting state after error during file processing.")
+        self.input_pdf_path = None
+        self.status_label.config(text="Okunabilir hale getirmek istediğin dosyayı seç veya alana sürükle", style="Status.TLabel", cursor="")
+        self.status_label.unbind("<Button-1>")
+        # Reset boxes to initial state
+        self.recreate_left_box_initial_content() # Handles left box clearing/redrawing
+        self.right_box.configure(bg="black") # Ensure right box is black on error reset
+        self.right_box.delete(self._BOX_CONTENT_TAG) # Clear right box, the border stays
+        self.set_button_state(tk.NORMAL)
+        self.app_state = "initial" # Reset state on error
+        # Ensure cursor is reset on error too if recreate doesn't handle it
+        self.left_box.config(cursor="")
 
     def recreate_left_box_initial_content(self):
         """Helper to redraw the initial icon and text in the left box."""
@@ -566,14 +1191,9 @@ class PDFDarkModeApp:
         box_height = 466
         fill_color = "black"
         border_color = "white"
-        border_width = 6
-        corner_radius = 10
 
-        # Clear and Re-draw border
-        self.left_box.delete("all")
-        create_rounded_rect(self.left_box, border_width/2, border_width/2,
-                            box_width - border_width/2, box_height - border_width/2,
-                            corner_radius, border_color, border_width, "")
+        # Clear previous content, the border stays
+        self.left_box.delete(self._BOX_CONTENT_TAG)
 
         # Re-create Icon Widget
         try:
@@ -595,8 +1215,8 @@ class PDFDarkModeApp:
         # Re-place elements onto the canvas
         icon_y_pos = box_height / 2 - 50
         text_y_pos = icon_y_pos + 100
-        self.left_box.create_window(box_width / 2, icon_y_pos, window=self.upload_icon_widget)
-        self.left_box.create_window(box_width / 2, text_y_pos, window=self.upload_text_widget)
+        self.left_box.create_window(box_width / 2, icon_y_pos, window=self.upload_icon_widget, tags=self._BOX_CONTENT_TAG)
+        self.left_box.create_window(box_width / 2, text_y_pos, window=self.upload_text_widget, tags=self._BOX_CONTENT_TAG)
 
         # Bind clicks to widgets for file selection
         logger.debug("Re-binding click events for initial left box content.")
@@ -631,7 +1251,7 @@ class PDFDarkModeApp:
 
         # Background of the canvas itself doesn't change, only border/text
         if hasattr(self, 'button_border_id'): # Ensure items exist
-             self.convert_button_canvas.itemconfig(self.button_border_id, outline=new_border_color)
+             set_rounded_rect_color(self.convert_button_canvas, self.button_border_id, new_border_color)
         if hasattr(self, 'button_text_id'):
              self.convert_button_canvas.itemconfig(self.button_text_id, fill=new_text_color)
 
@@ -653,75 +1273,127 @@ class PDFDarkModeApp:
             self.status_animation_after_id = None
             logger.debug("Status animation stopped.")
 
-    def update_progress(self, current_page, total_pages):
-        """Callback function to update progress bar from conversion thread."""
-        # Put progress data into the queue for the main thread to process
-        self.progress_queue.put((current_page, total_pages))
+    def start_conversion_executor(self):
+        """Starts the conversion executor if there is none (at startup or after a crash broke it)."""
+        if self.conversion_executor is not None:
+            return
+        # A single worker process, kept between files. Pool workers aren't daemons, so
+        # convert_pdf_colors can still start its own page worker pool inside it.
+        self.conversion_executor = ProcessPoolExecutor(max_workers=1, initializer=_init_conversion_process, initargs=(self.conversion_responses, self.conversion_cancel, dict(fallback_paths)))
+        self.conversion_executor.submit(preload_fallback_fonts) # Starts the process and loads fonts while the user picks a file
+        logger.info("Conversion executor started.")
+
+    def stop_conversion_executor(self):
+        """Shuts the conversion executor down, stopping a running conversion at its next page."""
+        if self.conversion_executor is None:
+            return
+        executor, self.conversion_executor = self.conversion_executor, None
+        self.conversion_cancel.set()
+        try:
+            # Runs after the cancelled conversion, so the page workers started inside the
+            # conversion process exit before it does instead of being orphaned
+            executor.submit(shutdown_page_pool)
+        except BrokenProcessPool:
+            pass # The conversion process is already gone
+        # Not waiting keeps the window responsive; at exit Python waits for the process to finish
+        executor.shutdown(wait=False)
+        logger.info("Conversion executor stopped.")
+
+    def on_close(self):
+        """Shuts down the conversion process before closing the window."""
+        self.stop_status_animation()
+        self.stop_conversion_executor()
+        self.conversion_responses.put(None) # Lets the listener thread finish
+        self.preview_executor.shutdown(wait=False)
+        self.root.destroy()
+
+    def set_progress_fill(self, progress_value: float):
+        """Resizes the progress bar fill to progress_value percent, redrawing only when its pixel width changes."""
+        fill_px = int((progress_value / 100) * self.progress_fill_area_width)
+        if fill_px == self.progress_fill_px:
+            return # Nothing visible would change
+        self.progress_fill_px = fill_px
+
+        # --- Update Custom Progress Bar Canvas --- 
+        if fill_px > 0:
+            x1 = self.progress_fill_x1
+            self.progress_canvas.coords(self.progress_fill_id, _rounded_rect_points(x1, self.progress_fill_y1, x1 + fill_px, self.progress_fill_y2, self._PROGRESS_CORNER))
+            self.progress_canvas.itemconfig(self.progress_fill_id, state=tk.NORMAL)
+        else:
+            self.progress_canvas.itemconfig(self.progress_fill_id, state=tk.HIDDEN) # No fill if width is zero
+
+    def post_gui_message(self, message):
+        """Any thread: queues a message for check_progress_queue and wakes the Tk thread."""
+        self.gui_messages.put(message)
+        if self.progress_event_pending:
+            return # The queued event hasn't run yet and will pick this message up too
+        self.progress_event_pending = True
+        try:
+            self.root.event_generate("<<Progress>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass # Window closed
+
+    def forward_conversion_responses(self):
+        """Listener thread: hands progress messages from the conversion process to the Tk thread."""
+        while True:
+            message = self.conversion_responses.get()
+            if message is None:
+                break
+            self.post_gui_message(message)
+
+    def forward_conversion_result(self, future):
+        """Executor callback: hands the conversion result (or failure) to the Tk thread."""
+        broken = False
+        try:
+            result = future.result()
+        except BrokenProcessPool as e:
+            logger.error("Conversion process exited unexpectedly: %s", e)
+            result = "Worker Error: conversion process exited unexpectedly"
+            broken = True
+        except Exception as e:
+            logger.error("Exception in conversion process: %s", e, exc_info=True)
+            result = f"Worker Error: {e}" # Ensure result indicates error
+        self.post_gui_message(("done", result, broken))
 
     def check_progress_queue(self):
         """Checks the queue for progress updates and handles completion."""
+        latest_progress = None # Only the newest progress message of a batch is drawn
+        # Cleared before draining: a message posted from now on needs a new event
+        self.progress_event_pending = False
         try:
             while True: # Process all pending messages
-                message = self.progress_queue.get_nowait()
-                if isinstance(message, tuple) and len(message) == 2:
-                    if message[0] == "DONE":
+                message = self.gui_messages.get_nowait()
+                if isinstance(message, tuple) and message:
+                    if message[0] == "done":
                         # Conversion finished message
-                        logger.debug("Received DONE signal from worker thread.")
-                        result = message[1]
+                        logger.debug("Received done signal from conversion process.")
+                        _, result, broken = message
+                        self.conversion_active = False
+                        if broken:
+                            self.stop_conversion_executor() # Replaced on the next conversion
                         self.handle_conversion_complete(result)
-                        self.conversion_thread = None # Clear thread reference
                         return # Stop checking queue
+                    elif message[0] == "progress":
+                        latest_progress = message
                     else:
-                        # --- Progress update message --- 
-                        current_page, total_pages = message
-                        progress_value = (current_page / total_pages) * 100
-                        logger.debug(f"Progress update received: {current_page}/{total_pages} ({progress_value:.1f}%)")
-
-                        # --- Update Custom Progress Bar Canvas --- 
-                        border_width = 6 # Make consistent
-                        corner_radius = 10
-                        progress_bar_height = 40
-                        fill_color = "white"
-
-                        # Calculate width of the fill area inside the border
-                        fill_area_width = self.progress_bar_width - border_width
-                        fill_rect_width = (progress_value / 100) * fill_area_width
-
-                        # Define coordinates for the fill rectangle
-                        x1 = border_width / 2
-                        y1 = border_width / 2
-                        x2 = x1 + fill_rect_width
-                        y2 = progress_bar_height - border_width / 2
-
-                        # Delete previous fill rectangle if it exists
-                        if self.progress_fill_id:
-                            self.progress_canvas.delete(self.progress_fill_id)
-
-                        # Draw the new fill rectangle (ensure x2 >= x1)
-                        if x2 > x1:
-                             # Use create_rounded_rect for fill for consistency
-                             self.progress_fill_id = create_rounded_rect(self.progress_canvas, x1, y1, x2, y2,
-                                                                           corner_radius, fill_color, 0, fill_color) # No border for fill, just fill
-                             # Raise the border item so it's drawn on top (assuming border is item ID 1, usually)
-                             # A safer way might be to store border ID, but this often works
-                             self.progress_canvas.tag_raise(1) # Attempt to raise the first item (border)
-                        else:
-                             self.progress_fill_id = None # No fill if width is zero
-
-                        self.root.update_idletasks() # Update UI immediately
+                        logger.warning("Received unexpected message in queue: %s", message)
                 else:
-                    logger.warning(f"Received unexpected message in queue: {message}")
+                    logger.warning("Received unexpected message in queue: %s", message)
 
         except queue.Empty:
             pass # No messages currently in queue
 
-        # If conversion thread is still referenced (meaning DONE not received yet), schedule next check
-        if self.conversion_thread:
-            self.root.after(100, self.check_progress_queue)
+        if latest_progress is not None and self.conversion_active:
+            # --- Progress update message --- 
+            _, current_page, total_pages = latest_progress
+            progress_value = (current_page / total_pages) * 100
+            logger.debug("Progress update received: %d/%d (%.1f%%)", current_page, total_pages, progress_value)
+
+            self.set_progress_fill(progress_value) # Tk redraws the canvas once we're back in the event loop
 
     def start_conversion_event(self, event):
          """Wrapper for start_conversion or reset based on state."""
-         logger.debug(f"Button clicked. Current state: {self.app_state}")
+         logger.debug("Button clicked. Current state: %s", self.app_state)
          if self.app_state == "finished":
              logger.info("Resetting application state.")
              self.reset_application()
@@ -729,26 +1401,10 @@ class PDFDarkModeApp:
              logger.info("Starting conversion.")
              self.start_conversion()
          else:
-             logger.warning(f"Button click ignored. State: {self.app_state}, Button State: {self.button_state}")
-
-    def conversion_worker(self):
-        """The actual work done in the conversion thread."""
-        result = None
-        try:
-            self.app_state = "converting" # Set state during conversion
-            logger.info(f"Conversion thread started: {self.input_pdf_path} -> {self.output_pdf_path}")
-            # Pass the queue-based callback method
-            result = convert_pdf_colors(self.input_pdf_path, self.output_pdf_path, self.update_progress)
-            logger.info("Conversion thread finished.")
-        except Exception as e:
-             logger.error(f"Exception in conversion worker thread: {e}", exc_info=True)
-             result = f"Thread Error: {e}" # Ensure result indicates error
-        finally:
-             # Put final result/status into the queue for main thread
-             self.progress_queue.put(("DONE", result))
+             logger.warning("Button click ignored. State: %s, Button State: %s", self.app_state, self.button_state)
 
     def start_conversion(self):
-        """Initiates the PDF conversion process in a background thread."""
+        """Sends the PDF to the conversion process."""
         if not self.input_pdf_path:
             messagebox.showwarning("No File Selected", "Lütfen önce dönüştürülecek bir PDF dosyası seçin.")
             return
@@ -760,19 +1416,13 @@ class PDFDarkModeApp:
         base_name = os.path.basename(self.input_pdf_path)
         output_filename = f"output_{base_name}"
         self.output_pdf_path = os.path.join(output_dir, output_filename)
-        logger.info(f"Output path set to: {self.output_pdf_path}")
+        logger.info("Output path set to: %s", self.output_pdf_path)
 
         # --- Update UI for Conversion Start ---
         logger.debug("Switching button to progress canvas.")
         self.convert_button_canvas.pack_forget()
-        # Clear previous fill if any
-        if self.progress_fill_id:
-            self.progress_canvas.delete(self.progress_fill_id)
-            self.progress_fill_id = None
-        # Ensure border is drawn (might be overkill but safe)
-        border_width = 6
-        corner_radius = 10
-        create_rounded_rect(self.progress_canvas, border_width/2, border_width/2, self.progress_bar_width - border_width/2, 40 - border_width/2, corner_radius, "white", border_width, "")
+        # Clear previous fill if any (border and fill are created once in __init__ and never deleted)
+        self.set_progress_fill(0)
         self.progress_canvas.pack() # Show progress canvas
         self.set_button_state(tk.DISABLED)
 
@@ -784,17 +1434,18 @@ class PDFDarkModeApp:
 
         self.root.update_idletasks() # Force UI update
 
-        # --- Start Conversion Thread ---
-        logger.info(f"Starting conversion worker thread for: {self.input_pdf_path}")
-        self.conversion_thread = threading.Thread(target=self.conversion_worker, daemon=True)
-        self.conversion_thread.start()
-
-        # --- Start checking the progress queue --- 
-        self.root.after(100, self.check_progress_queue)
+        # --- Hand the File to the Conversion Process ---
+        logger.info("Submitting conversion: %s -> %s", self.input_pdf_path, self.output_pdf_path)
+        self.start_conversion_executor() # Replaces one broken by a previous crash
+        self.conversion_cancel.clear()
+        self.app_state = "converting" # Set state during conversion
+        self.conversion_active = True
+        future = self.conversion_executor.submit(_convert_in_process, self.input_pdf_path, self.output_pdf_path)
+        future.add_done_callback(self.forward_conversion_result)
 
     def handle_conversion_complete(self, result):
-        """Handles UI updates after conversion thread finishes."""
-        logger.info(f"Handling conversion completion. Result: {result}")
+        """Handles UI updates after conversion finishes."""
+        logger.info("Handling conversion completion. Result: %s", result)
         # --- Final UI Updates ---
         self.stop_status_animation()
 
@@ -808,19 +1459,18 @@ class PDFDarkModeApp:
             # Success
             try:
                 # Create a shorter path for display
-                full_path = Path(self.output_pdf_path)
-                parts = full_path.parts
+                parts = self.output_pdf_path.replace("\\", "/").split("/")
                 if len(parts) > 3:
                     # Show ellipsis, last two folders, and filename
-                    short_path_display = os.path.join("...", parts[-3], parts[-2], parts[-1])
+                    short_path_display = ".../" + "/".join(parts[-3:])
                 else:
                     # Show full path if it's already short
-                    short_path_display = str(full_path)
+                    short_path_display = self.output_pdf_path
                 success_msg = f"Dönüştürme başarılı! | {short_path_display}"
-                logger.info(f"Displaying short path: {short_path_display} (Full: {self.output_pdf_path})")
+                logger.info("Displaying short path: %s (Full: %s)", short_path_display, self.output_pdf_path)
             except Exception as path_err:
                 # Fallback to full path if shortening fails
-                logger.error(f"Error shortening path: {path_err}", exc_info=True)
+                logger.error("Error shortening path: %s", path_err, exc_info=True)
                 success_msg = f"Dönüştürme başarılı! | {self.output_pdf_path}"
 
             # Configure label for clickable appearance and bind event (to open folder)
@@ -828,7 +1478,7 @@ class PDFDarkModeApp:
             self.status_label.bind("<Button-1>", self.open_output_location)
             self.app_state = "finished"
             self.set_button_state(tk.NORMAL) # Ensure button is visually enabled
-            logger.info(f"Conversion successful: {self.output_pdf_path}, App state: {self.app_state}")
+            logger.info("Conversion successful: %s, App state: %s", self.output_pdf_path, self.app_state)
             
             # Show output preview in right box
             self.show_output_preview()
@@ -849,86 +1499,90 @@ class PDFDarkModeApp:
             self.set_button_state(tk.NORMAL) # Re-enable button
             # Set button text back to default on error
             self.convert_button_canvas.itemconfig(self.button_text_id, text="DÖNÜŞTÜR")
-            logger.error(f"Conversion failed: {result}, App state reset to: {self.app_state}")
+            logger.error("Conversion failed: %s, App state reset to: %s", result, self.app_state)
             # Reset input state? Optional
             # self.input_pdf_path = None
             # self.recreate_left_box_initial_content()
 
     def show_output_preview(self):
-        """Renders and displays the first page of the OUTPUT PDF in the right box."""
-        logger.debug(f"Attempting to show preview of output file: {self.output_pdf_path}")
+        """Displays the first page of the OUTPUT PDF in the right box, rendering it in the background if needed."""
+        logger.debug("Attempting to show preview of output file: %s", self.output_pdf_path)
         if not self.output_pdf_path or not os.path.exists(self.output_pdf_path):
-             logger.error(f"Output file path not valid or file doesn't exist: {self.output_pdf_path}")
-             self.right_box.delete("all")
-             create_rounded_rect(self.right_box, 6/2, 6/2, 371 - 6/2, 466 - 6/2, 10, "white", 6, "") # Redraw border
-             self.right_box.create_text(371/2, 466/2, text="Önizleme Yok", fill="#555555", font=("Inter", 18, "bold"))
+             logger.error("Output file path not valid or file doesn't exist: %s", self.output_pdf_path)
+             self.right_box.delete(self._BOX_CONTENT_TAG)
+             self.right_box.create_text(371/2, 466/2, text="Önizleme Yok", fill="#555555", font=("Inter", 18, "bold"), tags=self._BOX_CONTENT_TAG)
              return
 
-        doc = None
         try:
             box_width = 371
             box_height = 466
             border_width = 6
-            corner_radius = 10
-            logger.debug("Opening OUTPUT PDF document for preview.")
-            doc = fitz.open(self.output_pdf_path)
-            if len(doc) == 0: raise ValueError("Output PDF document has no pages.")
-            page = doc[0]
-
-            target_width_available = box_width - (2 * border_width)
-            target_height_available = box_height - (2 * border_width)
-            page_rect = page.rect
-            page_width = page_rect.width
-            page_height = page_rect.height
-            if page_width <= 0 or page_height <= 0:
-                 raise ValueError(f"Invalid page dimensions in output PDF: {page_width}x{page_height}")
-
-            zoom_w = target_width_available / page_width
-            zoom_h = target_height_available / page_height
-            zoom = min(zoom_w, zoom_h)
-            final_width = int(page_width * zoom)
-            final_height = int(page_height * zoom)
-            mat = fitz.Matrix(1, 1)
-            pix = page.get_pixmap(matrix=mat, dpi=150)
-            if doc: doc.close(); doc = None
-
-            if pix.alpha:
-                pil_image = Image.frombytes("RGBA", [pix.width, pix.height], pix.samples)
-            else:
-                pil_image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            resized_pil_image = pil_image.resize((final_width, final_height), Image.Resampling.LANCZOS)
-            self.output_preview_image_tk = ImageTk.PhotoImage(resized_pil_image) # Use separate attribute
-            logger.debug(f"Output preview PhotoImage created: {self.output_preview_image_tk}")
-
-            # Display in Right Box (with WHITE background)
-            logger.debug("Setting right box background to white for output preview.")
-            self.right_box.configure(bg="white") # <--- Set background to white HERE
-            self.right_box.delete("all")
-            create_rounded_rect(self.right_box, border_width/2, border_width/2, box_width - border_width/2, box_height - border_width/2, corner_radius, "white", border_width, "") # Border is still white
-            self.right_box.create_image(box_width / 2, box_height / 2, anchor=tk.CENTER, image=self.output_preview_image_tk)
-            logger.debug("Output preview displayed in right box.")
-
-            # Ensure cursor is set correctly based on app state after preview shows
-            if self.app_state == "finished":
-                self.right_box.config(cursor="hand2")
-            else:
-                 self.right_box.config(cursor="")
+            cache_key = (self.output_pdf_path, os.path.getmtime(self.output_pdf_path), box_width, box_height)
+            cached_preview = self.output_preview_cache.get(cache_key)
+            if cached_preview is not None:
+                logger.debug("Using cached output preview.")
+                self.output_preview_cache.move_to_end(cache_key)
+                self.display_output_preview(cached_preview)
+                return
+
+            # fitz and Pillow release the GIL while rendering, so the UI stays responsive;
+            # only the PhotoImage has to be created back on the Tk thread
+            logger.debug("Rendering output preview in the background.")
+            future = self.preview_executor.submit(render_preview_image, self.output_pdf_path, box_width, box_height, border_width)
+            future.add_done_callback(lambda done: self.root.after(0, self.finish_output_preview, cache_key, done))
+        except Exception as e:
+             self.show_output_preview_error(e)
 
+    def finish_output_preview(self, cache_key, future):
+        """Tk thread: turns a background-rendered output preview into a PhotoImage and displays it."""
+        if cache_key[0] != self.output_pdf_path:
+            logger.debug("Discarding output preview of %s, no longer the current output.", cache_key[0])
+            return
+        try:
+            pix, pil_image = future.result() # pix owns the memory pil_image wraps
+            output_preview = ImageTk.PhotoImage(pil_image)
+            logger.debug("Output preview PhotoImage created: %s", output_preview)
         except Exception as e:
-             if doc: doc.close()
-             error_msg = f"Error generating output preview: {e}"
-             logger.error(error_msg, exc_info=True)
-             logger.debug("Setting right box background back to black after preview error.")
-             self.right_box.configure(bg="black") # Set back to black on error
-             self.right_box.delete("all")
-             create_rounded_rect(self.right_box, 6/2, 6/2, 371 - 6/2, 466 - 6/2, 10, "white", 6, "") # Redraw border
-             self.right_box.create_text(371/2, 466/2, text="Önizleme Hatası", fill="#FF0000", font=("Inter", 18, "bold"))
+            self.show_output_preview_error(e)
+            return
+        self.output_preview_cache[cache_key] = output_preview
+        if len(self.output_preview_cache) > OUTPUT_PREVIEW_CACHE_SIZE:
+            self.output_preview_cache.popitem(last=False) # Drop the least recently used preview
+        self.display_output_preview(output_preview)
+
+    def display_output_preview(self, output_preview):
+        """Shows an output preview image in the right box."""
+        box_width = 371
+        box_height = 466
+        self.output_preview_image_tk = output_preview # Keep a reference, Tk doesn't
+
+        # Display in Right Box (with WHITE background)
+        logger.debug("Setting right box background to white for output preview.")
+        self.right_box.configure(bg="white") # <--- Set background to white HERE
+        self.right_box.delete(self._BOX_CONTENT_TAG) # Border is still white
+        self.right_box.create_image(box_width / 2, box_height / 2, anchor=tk.CENTER, image=self.output_preview_image_tk, tags=self._BOX_CONTENT_TAG)
+        logger.debug("Output preview displayed in right box.")
+
+        # Ensure cursor is set correctly based on app state after preview shows
+        if self.app_state == "finished":
+            self.right_box.config(cursor="hand2")
+        else:
+             self.right_box.config(cursor="")
+
+    def show_output_preview_error(self, error):
+        """Shows the preview error state in the right box."""
+        error_msg = f"Error generating output preview: {error}"
+        logger.error(error_msg, exc_info=error)
+        logger.debug("Setting right box background back to black after preview error.")
+        self.right_box.configure(bg="black") # Set back to black on error
+        self.right_box.delete(self._BOX_CONTENT_TAG)
+        self.right_box.create_text(371/2, 466/2, text="Önizleme Hatası", fill="#FF0000", font=("Inter", 18, "bold"), tags=self._BOX_CONTENT_TAG)
 
     def open_output_pdf(self, event=None):
         """Opens the generated PDF file in the default system viewer."""
-        logger.info(f"Attempting to open output PDF: {self.output_pdf_path}")
+        logger.info("Attempting to open output PDF: %s", self.output_pdf_path)
         if not self.output_pdf_path or not os.path.exists(self.output_pdf_path):
-            logger.warning(f"Output path is not set or file does not exist: {self.output_pdf_path}")
+            logger.warning("Output path is not set or file does not exist: %s", self.output_pdf_path)
             messagebox.showwarning("File Not Found", "Oluşturulan PDF dosyası bulunamadı.")
             return
 
@@ -937,72 +1591,58 @@ class PDFDarkModeApp:
 
         try:
             if system == "Windows":
-                logger.debug(f"Running command: os.startfile(\"{filepath}\")")
+                logger.debug("Running command: os.startfile(\"%s\")", filepath)
                 os.startfile(filepath)
             elif system == "Darwin": # macOS
-                logger.debug(f"Running command: open \"{filepath}\"")
-                subprocess.run(['open', filepath], check=True)
+                logger.debug("Running command: open \"%s\"", filepath)
+                subprocess.Popen(['open', filepath], start_new_session=True) # Don't wait for the viewer to start
             else: # Linux and other Unix-like systems
-                logger.debug(f"Running command: xdg-open \"{filepath}\"")
-                subprocess.run(['xdg-open', filepath], check=True)
-            logger.info(f"Successfully initiated opening of {filepath}")
+                logger.debug("Running command: xdg-open \"%s\"", filepath)
+                subprocess.Popen(['xdg-open', filepath], start_new_session=True)
+            logger.info("Successfully initiated opening of %s", filepath)
         except FileNotFoundError:
-            logger.error(f"Command not found for opening PDF on {system}.")
+            logger.error("Command not found for opening PDF on %s.", system)
             messagebox.showerror("Error", f"Varsayılan PDF görüntüleyici açılamadı ({system}).")
         except Exception as e:
-            logger.error(f"Failed to open PDF file '{filepath}' on {system}: {e}", exc_info=True)
+            logger.error("Failed to open PDF file '%s' on %s: %s", filepath, system, e, exc_info=True)
             messagebox.showerror("Error", f"PDF dosyası açılamadı: {e}")
 
     def open_output_location(self, event=None):
         """Opens the file explorer to the location of the output PDF."""
-        logger.info(f"Attempting to open file location for: {self.output_pdf_path}")
+        logger.info("Attempting to open file location for: %s", self.output_pdf_path)
         if not self.output_pdf_path or not os.path.exists(self.output_pdf_path):
-            logger.warning(f"Output path is not set or file does not exist: {self.output_pdf_path}")
+            logger.warning("Output path is not set or file does not exist: %s", self.output_pdf_path)
             messagebox.showwarning("File Not Found", "Oluşturulan PDF dosyası bulunamadı.")
             return
 
         filepath_raw = self.output_pdf_path
         system = platform.system()
-        return_code = None # Variable to store return code
 
+        # The file manager is started without waiting for it, explorer /select in particular
+        # can take a noticeable time to return and the window would freeze meanwhile
         try:
             if system == "Windows":
                 filepath_norm = os.path.normpath(filepath_raw)
                 command = ['explorer', '/select,', filepath_norm]
-                logger.debug(f"Running command: {' '.join(command)}")
-                # Run without check=True, but capture the result
-                result = subprocess.run(command)
-                return_code = result.returncode
-                logger.info(f"'explorer /select' command finished with return code: {return_code}")
-                # Don't raise error for common non-zero codes if explorer still worked
-                if return_code != 0:
-                     logger.warning(f"'explorer /select' returned non-zero exit status {return_code}. This might be okay if the folder opened.")
-
             elif system == "Darwin": # macOS
                 filepath_norm = os.path.normpath(filepath_raw)
                 command = ['open', '-R', filepath_norm]
-                logger.debug(f"Running command: {' '.join(command)}")
-                result = subprocess.run(command, check=True) # Keep check=True for macOS
-                return_code = result.returncode
-                logger.info(f"'open -R' command finished with return code: {return_code}")
-
             else: # Linux and other Unix-like systems
                 directory = os.path.dirname(os.path.normpath(filepath_raw))
                 command = ['xdg-open', directory]
-                logger.debug(f"Running command: {' '.join(command)}")
-                result = subprocess.run(command, check=True) # Keep check=True for Linux
-                return_code = result.returncode
-                logger.info(f"'xdg-open' command finished with return code: {return_code}")
+            logger.debug("Running command: %s", ' '.join(command))
+            subprocess.Popen(command, start_new_session=True)
+            logger.info("Started '%s' to show the output location.", command[0])
 
         except FileNotFoundError:
-             logger.error(f"Command not found for opening file explorer on {system}.")
+             logger.error("Command not found for opening file explorer on %s.", system)
              messagebox.showerror("Error", f"Dosya gezgini açılamadı ({system}). Komut bulunamadı.")
-        except subprocess.CalledProcessError as e: # Catch errors only for non-Windows check=True cases
-             logger.error(f"Command failed for {system}: {e}", exc_info=True)
+        except OSError as e:
+             logger.error("Command failed for %s: %s", system, e, exc_info=True)
              messagebox.showerror("Error", f"Dosya konumu açılamadı ({system}): {e}")
         except Exception as e:
              # Catch other potential errors like permission issues
-             logger.error(f"Failed to open file location '{filepath_raw}' on {system}: {e}", exc_info=True)
+             logger.error("Failed to open file location '%s' on %s: %s", filepath_raw, system, e, exc_info=True)
              messagebox.showerror("Error", f"Dosya konumu açılırken genel bir hata oluştu: {e}")
 
     def reset_application(self):
@@ -1010,6 +1650,7 @@ class PDFDarkModeApp:
         logger.info("Resetting application UI and state.")
         self.input_pdf_path = None
         self.output_pdf_path = None
+        self.output_preview_cache.clear()
         self.app_state = "initial"
 
         # Reset status label to default non-clickable state
@@ -1022,15 +1663,9 @@ class PDFDarkModeApp:
         # Reset right box (clear preview, set background to black, remove click)
         logger.debug("Resetting right box: setting background to black, clearing content, removing click.")
         self.right_box.configure(bg="black") 
-        self.right_box.delete("all")
+        self.right_box.delete(self._BOX_CONTENT_TAG)
         self.right_box.config(cursor="") # Reset cursor
         self.right_box.unbind("<Button-1>") # Unbind click
-        # Define dimensions needed for border redraw
-        box_width = 371
-        box_height = 466
-        border_width = 6
-        corner_radius = 10
-        create_rounded_rect(self.right_box, border_width/2, border_width/2, box_width - border_width/2, box_height - border_width/2, corner_radius, "white", border_width, "")
 
         # Reset button text and state
         self.convert_button_canvas.itemconfig(self.button_text_id, text="DÖNÜŞTÜR")
@@ -1040,6 +1675,9 @@ class PDFDarkModeApp:
 
 # --- Main execution block ---
 if __name__ == "__main__":
+    # Required for the page worker processes in the PyInstaller build
+    multiprocessing.freeze_support()
+
     # --- Fallback Font Configuration ---
     # Use global fallback_paths defined at the top
     fallback_paths.update({
@@ -0,0 +1,28 @@
+import fitz
+
+import pdf_processor
+
+
+def test_base14_text_with_winansi_punctuation_is_not_embedded(tmp_path):
+    input_path = str(tmp_path / "quotes.pdf")
+    output_path = str(tmp_path / "quotes_dark.pdf")
+    text = "“Curly” ‘quotes’ – dash… €5 • Brand™"
+    doc = fitz.open()
+    page = doc.new_page()
+    # A Base-14 Helvetica span in WinAnsiEncoding; insert_text can't write its 0x80-0x9F characters
+    page.insert_font(fontname="helv")
+    content_xref = doc.get_new_xref()
+    doc.update_object(content_xref, "<<>>")
+    doc.update_stream(content_xref, b"BT /helv 12 Tf 72 700 Td <%s> Tj ET" % text.encode("cp1252").hex().encode())
+    doc.xref_set_key(page.xref, "Contents", "%d 0 R" % content_xref)
+    doc.save(input_path)
+    doc.close()
+
+    assert pdf_processor.convert_pdf_colors(input_path, output_path, num_workers=1) is None
+
+    out = fitz.open(output_path)
+    fonts = out[0].get_fonts()
+    assert [(font[2], font[3], font[5]) for font in fonts] == [("Type1", "Helvetica", "WinAnsiEncoding")]
+    assert all(font[1] == "n/a" for font in fonts) # Referenced, no font program embedded
+    assert out[0].get_text().strip() == text
+    out.close()